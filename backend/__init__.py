@@ -0,0 +1 @@
+"""RescueRoute AI backend service."""
@@ -1,14 +1,47 @@
 import os
 
+import hashlib
+import json
 import logging
-from typing import List, Optional
+import math
+import time
+from collections import OrderedDict
+from typing import List, NamedTuple, Optional
 from pydantic import BaseModel, Field
 from google import genai
-from models import SimulationState
+
+try:
+    from .models import SimulationState
+except ImportError:
+    from models import SimulationState
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Decision cache settings: exact hits are reused for the TTL, near-identical
+# states (same robots/missions, small drift) are reused by fingerprint distance.
+DECISION_CACHE_TTL_SECONDS = 60.0
+DECISION_CACHE_MAX_ENTRIES = 128
+DECISION_CACHE_MAX_DISTANCE = 0.01
+
+# Fixed instruction preamble sent as the system instruction so every request
+# shares the same prompt prefix; only the live state goes in the contents.
+COMMANDER_INSTRUCTIONS = """You are the AI Commander of a robot fleet.
+Analyze the simulation state you are given and decide on the next best action.
+Prioritize high-priority missions and ensure efficient battery usage.
+
+The state is compact JSON:
+- "s": simulation step
+- "r": robots as [id, x, y, battery %, status, current mission id or null];
+  status I=idle, M=moving, C=charging, D=dead
+- "m": open missions as [id, priority, target x, target y, status, robot id or null];
+  priority H/M/L, status P=pending, I=in progress
+- "c": number of completed missions"""
+
+_ROBOT_STATUSES = ("IDLE", "MOVING", "CHARGING", "DEAD")
+_MISSION_PRIORITIES = ("High", "Medium", "Low")
+_MISSION_STATUSES = ("PENDING", "IN_PROGRESS", "COMPLETED")
+
 
 # Define Pydantic models for structured output
 class Reassignment(BaseModel):
@@ -26,7 +59,139 @@ class Decision(BaseModel):
     reasoning: str = Field(description="Explanation of the decision")
 
 
-def make_decision(state: SimulationState) -> Optional[Decision]:
+class _CachedDecision(NamedTuple):
+    expires_at: float
+    shape: str
+    fingerprint: List[float]
+    decision: dict
+
+
+_decision_cache: "OrderedDict[str, _CachedDecision]" = OrderedDict()
+
+
+def cache_key(state: SimulationState) -> str:
+    """Canonical SHA-256 of the state, ignoring the poll step counter."""
+    canonical = json.dumps(state.model_dump(exclude={"step"}), sort_keys=True)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _system_instruction(state: SimulationState) -> str:
+    # The map only changes when the simulator resets, so it belongs with the
+    # stable prefix rather than the per-step contents.
+    return f"{COMMANDER_INSTRUCTIONS}\n\nMap:\n{state.grid.model_dump_json()}"
+
+
+def _compact_state(state: SimulationState) -> str:
+    # Short keys, single-letter enums and integer battery keep the prompt
+    # small; the legend lives in COMMANDER_INSTRUCTIONS.
+    compact = {
+        "s": state.step,
+        "r": [
+            [
+                r.id,
+                r.position[0],
+                r.position[1],
+                round(r.battery),
+                r.status[:1],
+                r.current_mission,
+            ]
+            for r in state.robots
+        ],
+        "m": [
+            [m.id, m.priority[:1], m.target[0], m.target[1], m.status[:1], m.assigned_robot]
+            for m in state.active_missions
+        ],
+        "c": len(state.completed_missions),
+    }
+    return json.dumps(compact, separators=(",", ":"))
+
+
+def _one_hot(value: str, choices: tuple) -> List[float]:
+    return [1.0 if value == choice else 0.0 for choice in choices]
+
+
+def _state_shape(state: SimulationState) -> str:
+    # Decisions reference robot and mission ids, so only states with the same
+    # ids are eligible for near-miss reuse.
+    robot_ids = sorted(robot.id for robot in state.robots)
+    mission_ids = sorted(mission.id for mission in state.active_missions)
+    return ",".join(robot_ids) + "|" + ",".join(mission_ids)
+
+
+def _state_fingerprint(state: SimulationState) -> List[float]:
+    width = max(state.grid.width, 1)
+    height = max(state.grid.height, 1)
+    vector: List[float] = []
+    for robot in sorted(state.robots, key=lambda r: r.id):
+        vector.append(robot.position[0] / width)
+        vector.append(robot.position[1] / height)
+        vector.append((max(0.0, min(100.0, robot.battery)) // 10) / 10)
+        vector.extend(_one_hot(robot.status, _ROBOT_STATUSES))
+    for mission in sorted(state.active_missions, key=lambda m: m.id):
+        vector.extend(_one_hot(mission.priority, _MISSION_PRIORITIES))
+        vector.extend(_one_hot(mission.status, _MISSION_STATUSES))
+    return vector
+
+
+def _cosine_distance(a: List[float], b: List[float]) -> float:
+    norm_a = math.sqrt(sum(x * x for x in a))
+    norm_b = math.sqrt(sum(y * y for y in b))
+    if not norm_a or not norm_b:
+        return 0.0 if norm_a == norm_b else 1.0
+    dot = sum(x * y for x, y in zip(a, b))
+    return 1.0 - dot / (norm_a * norm_b)
+
+
+def _cache_lookup(key: str, shape: str, fingerprint: List[float]) -> Optional[Decision]:
+    now = time.monotonic()
+    expired = [k for k, entry in _decision_cache.items() if entry.expires_at <= now]
+    for k in expired:
+        del _decision_cache[k]
+
+    hit_key = key if key in _decision_cache else None
+    if hit_key is None:
+        # Most recently used entries first: they are the likeliest neighbours.
+        for k in reversed(_decision_cache):
+            entry = _decision_cache[k]
+            if (
+                entry.shape == shape
+                and len(entry.fingerprint) == len(fingerprint)
+                and _cosine_distance(entry.fingerprint, fingerprint)
+                < DECISION_CACHE_MAX_DISTANCE
+            ):
+                hit_key = k
+                break
+    if hit_key is None:
+        return None
+
+    _decision_cache.move_to_end(hit_key)
+    logger.info("AI decision cache hit (%s)", "exact" if hit_key == key else "similar")
+    return Decision.model_validate(_decision_cache[hit_key].decision)
+
+
+def _cache_store(
+    key: str, shape: str, fingerprint: List[float], decision: Decision
+) -> None:
+    entry = _CachedDecision(
+        expires_at=time.monotonic() + DECISION_CACHE_TTL_SECONDS,
+        shape=shape,
+        fingerprint=fingerprint,
+        decision=decision.model_dump(),
+    )
+    _decision_cache[key] = entry
+    _decision_cache.move_to_end(key)
+    while len(_decision_cache) > DECISION_CACHE_MAX_ENTRIES:
+        _decision_cache.popitem(last=False)
+
+
+async def make_decision(state: SimulationState) -> Optional[Decision]:
+    key = cache_key(state)
+    shape = _state_shape(state)
+    fingerprint = _state_fingerprint(state)
+    cached = _cache_lookup(key, shape, fingerprint)
+    if cached is not None:
+        return cached
+
     api_key = os.environ.get("GEMINI_API_KEY")
     if not api_key:
         logger.error("GEMINI_API_KEY not found in environment variables.")
@@ -35,26 +200,11 @@ def make_decision(state: SimulationState) -> Optional[Decision]:
     try:
         client = genai.Client(api_key=api_key)
 
-        # Construct prompt from state
-        prompt = f"""
-        You are the AI Commander of a robot fleet.
-        Current Simulation Step: {state.step}
-        
-        Active Ops:
-        - Robots: {len(state.robots)}
-        - Active Missions: {len(state.active_missions)}
-        
-        Analyze the following state and decide on the next best action.
-        Prioritize high-priority missions and ensure efficient battery usage.
-        
-        State Data:
-        {state.model_dump_json()}
-        """
-
-        response = client.models.generate_content(
+        response = await client.aio.models.generate_content(
             model="gemini-2.5-flash",  # efficient model for this task
-            contents=prompt,
+            contents=_compact_state(state),
             config={
+                "system_instruction": _system_instruction(state),
                 "response_mime_type": "application/json",
                 "response_schema": Decision,
                 "http_options": {"timeout": 15000},  # 15s timeout in ms
@@ -62,6 +212,8 @@ def make_decision(state: SimulationState) -> Optional[Decision]:
         )
 
         decision = response.parsed
+        if decision is not None:
+            _cache_store(key, shape, fingerprint, decision)
         return decision
 
     except Exception as e:
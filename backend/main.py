@@ -3,16 +3,40 @@ import json
 import logging
 import os
 from contextlib import asynccontextmanager
-from typing import Dict, List, Optional
-from urllib import error, request as urlrequest
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
 
+import httpx
+import numpy as np
+import orjson
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from sse_starlette.sse import EventSourceResponse
 
-from ai_decision import make_decision
-from models import MapGrid, Metrics, Mission, RobotState, SimulationState
+# Imported as the ``backend`` package (simulation/main.py) or as top-level
+# modules when started with ``uvicorn main:app`` from backend/.
+try:
+    from .ai_decision import Decision, make_decision
+    from .models import (
+        MapGrid,
+        Metrics,
+        Mission,
+        RobotState,
+        SimulationState,
+        SimulationStateUpdate,
+    )
+except ImportError:
+    from ai_decision import Decision, make_decision
+    from models import (
+        MapGrid,
+        Metrics,
+        Mission,
+        RobotState,
+        SimulationState,
+        SimulationStateUpdate,
+    )
 
 load_dotenv()
 os.makedirs("logs", exist_ok=True)
@@ -23,10 +47,22 @@ logging.basicConfig(
     handlers=[logging.FileHandler("logs/backend.log"), logging.StreamHandler()],
 )
 logger = logging.getLogger(__name__)
+# httpx logs every request at INFO, which would flood the log on each poll.
+logging.getLogger("httpx").setLevel(logging.WARNING)
 
 SIMULATOR_BASE_URL = os.getenv("SIMULATOR_BASE_URL", "http://127.0.0.1:8001").rstrip("/")
 SIM_POLL_INTERVAL_SECONDS = float(os.getenv("SIM_POLL_INTERVAL_SECONDS", "1.0"))
 SIM_GRID_SIZE = int(os.getenv("SIM_GRID_SIZE", "50"))
+SSE_DISCONNECT_CHECK_SECONDS = 15.0
+AI_BATCH_WINDOW_SECONDS = 0.05
+# Gemini calls time out after 15 s; allow for the batch window on top.
+AI_DECISION_TIMEOUT_SECONDS = 16.0
+AI_LOG_PATH = "logs/ai_decisions.jsonl"
+AI_LOG_FLUSH_INTERVAL_SECONDS = 0.1
+AI_LOG_MAX_BATCH = 64
+
+ROBOT_STATUS_CODES = {"IDLE": 0, "MOVING": 1, "CHARGING": 2, "DEAD": 3}
+ROBOT_STATUS_DEAD = ROBOT_STATUS_CODES["DEAD"]
 
 
 def _parse_allowed_origins() -> List[str]:
@@ -42,83 +78,166 @@ def _parse_allowed_origins() -> List[str]:
     ]
 
 
+def _with_canonical_keys(mapping: Dict[str, str]) -> Dict[str, str]:
+    # Accept both the simulator's spelling and already-translated values so the
+    # hot path can skip str()/lower() calls for every robot and mission.
+    table = dict(mapping)
+    table.update({value: value for value in mapping.values()})
+    return table
+
+
+_ROBOT_STATUS_TABLE = _with_canonical_keys(
+    {"idle": "IDLE", "moving": "MOVING", "charging": "CHARGING", "dead": "DEAD"}
+)
+_PRIORITY_TABLE = _with_canonical_keys({"high": "High", "medium": "Medium", "low": "Low"})
+_MISSION_STATUS_TABLE = _with_canonical_keys(
+    {"pending": "PENDING", "active": "IN_PROGRESS", "completed": "COMPLETED"}
+)
+
+
 def _status_to_ui(status: str) -> str:
-    mapping = {
-        "idle": "IDLE",
-        "moving": "MOVING",
-        "charging": "CHARGING",
-        "dead": "DEAD",
-    }
-    return mapping.get(str(status).lower(), str(status).upper())
+    return _ROBOT_STATUS_TABLE.get(str(status).lower(), str(status).upper())
 
 
 def _priority_to_ui(priority: str) -> str:
-    mapping = {"high": "High", "medium": "Medium", "low": "Low"}
-    return mapping.get(str(priority).lower(), str(priority))
+    return _PRIORITY_TABLE.get(str(priority).lower(), str(priority))
 
 
 def _mission_status_to_ui(status: str) -> str:
-    mapping = {
-        "pending": "PENDING",
-        "active": "IN_PROGRESS",
-        "completed": "COMPLETED",
-    }
-    return mapping.get(str(status).lower(), str(status).upper())
+    return _MISSION_STATUS_TABLE.get(str(status).lower(), str(status).upper())
 
 
-current_state = SimulationState(
-    step=0,
-    robots=[],
-    grid=MapGrid(width=SIM_GRID_SIZE, height=SIM_GRID_SIZE, obstacles=[], charging_stations=[]),
-    active_missions=[],
-    completed_missions=[],
-)
+@dataclass(frozen=True)
+class FleetTotals:
+    """Fleet aggregates ``/api/v1/metrics`` needs, computed once per snapshot.
+
+    The battery and status columns are only used to compute the totals and
+    are not kept on the snapshot.
+    """
+
+    robot_count: int
+    active_count: int
+    total_battery: float
+
+    @classmethod
+    def from_robots(cls, robots: List[RobotState]) -> "FleetTotals":
+        battery = np.fromiter((r.battery for r in robots), dtype=np.float64, count=len(robots))
+        status = np.fromiter(
+            (ROBOT_STATUS_CODES.get(r.status, -1) for r in robots),
+            dtype=np.int8,
+            count=len(robots),
+        )
+        return cls(
+            robot_count=len(robots),
+            active_count=int(np.count_nonzero(status != ROBOT_STATUS_DEAD)),
+            total_battery=float(np.clip(battery, 0.0, 100.0).sum()),
+        )
+
+
+@dataclass(frozen=True)
+class StateSnapshot:
+    """Everything published per update, swapped in as a single reference."""
 
-latest_simulator_metrics: Dict[str, float] = {
-    "avg_completion_time": 0.0,
-    "total_distance_traveled": 0.0,
-}
+    state: SimulationState
+    state_json: str
+    version: int
+    fleet: FleetTotals
+    simulator_metrics: Dict[str, float]
 
-state_lock = asyncio.Lock()
+
+def _make_snapshot(
+    state: SimulationState, version: int, simulator_metrics: Dict[str, float]
+) -> StateSnapshot:
+    return StateSnapshot(
+        state=state,
+        state_json=state.model_dump_json(),
+        version=version,
+        fleet=FleetTotals.from_robots(state.robots),
+        simulator_metrics=simulator_metrics,
+    )
+
+
+current_snapshot = _make_snapshot(
+    SimulationState(
+        step=0,
+        robots=[],
+        grid=MapGrid(
+            width=SIM_GRID_SIZE, height=SIM_GRID_SIZE, obstacles=[], charging_stations=[]
+        ),
+        active_missions=[],
+        completed_missions=[],
+    ),
+    version=0,
+    simulator_metrics={"avg_completion_time": 0.0, "total_distance_traveled": 0.0},
+)
+
+# Set (and replaced by a fresh event) on every publish, waking all SSE clients.
+state_changed = asyncio.Event()
 poller_task: Optional[asyncio.Task] = None
+simulator_client: Optional[httpx.AsyncClient] = None
+# Created in lifespan so it binds to the loop that runs the batcher.
+ai_request_queue: "Optional[asyncio.Queue[Tuple[SimulationState, asyncio.Future]]]" = None
+ai_batcher_task: Optional[asyncio.Task] = None
+ai_log_queue: "Optional[asyncio.Queue[dict]]" = None
+ai_log_task: Optional[asyncio.Task] = None
+
+
+def _publish_state(
+    state: SimulationState, simulator_metrics: Optional[Dict[str, float]] = None
+) -> None:
+    # Readers take no lock: they grab ``current_snapshot`` once and use that
+    # immutable object, so a single rebind is the whole update.
+    global current_snapshot, state_changed
+    previous = current_snapshot
+    current_snapshot = _make_snapshot(
+        state,
+        version=previous.version + 1,
+        simulator_metrics=(
+            simulator_metrics if simulator_metrics is not None else previous.simulator_metrics
+        ),
+    )
+    state_changed.set()
+    state_changed = asyncio.Event()
 
 
 def _convert_simulation_state(payload: dict, step: int) -> SimulationState:
+    # Build plain containers and validate the whole tree in a single
+    # model_validate call instead of constructing each model in Python.
+    robot_status = _ROBOT_STATUS_TABLE.get
     robots = []
     for robot in payload.get("robots", []):
         mission_id = robot.get("mission_id")
+        status = robot.get("status", "idle")
         robots.append(
-            RobotState(
-                id=str(robot.get("id")),
-                position=(int(robot.get("x", 0)), int(robot.get("y", 0))),
-                battery=float(robot.get("battery", 0.0)),
-                status=_status_to_ui(str(robot.get("status", "idle"))),
-                current_mission=str(mission_id) if mission_id is not None else None,
-            )
+            {
+                "id": str(robot.get("id")),
+                "position": (int(robot.get("x", 0)), int(robot.get("y", 0))),
+                "battery": float(robot.get("battery", 0.0)),
+                "status": robot_status(status) or _status_to_ui(status),
+                "current_mission": str(mission_id) if mission_id is not None else None,
+            }
         )
 
-    def to_mission(item: dict) -> Mission:
+    priority_label = _PRIORITY_TABLE.get
+    mission_status = _MISSION_STATUS_TABLE.get
+    active_missions = []
+    completed_missions = []
+    for item in payload.get("missions", []):
         target = item.get("target") or {}
         assigned_robot = item.get("assigned_robot")
-        return Mission(
-            id=str(item.get("id")),
-            priority=_priority_to_ui(str(item.get("priority", "low"))),
-            target=(int(target.get("x", 0)), int(target.get("y", 0))),
-            status=_mission_status_to_ui(str(item.get("status", "pending"))),
-            assigned_robot=str(assigned_robot) if assigned_robot is not None else None,
-        )
-
-    mission_rows = payload.get("missions", [])
-    active_missions = [
-        to_mission(mission)
-        for mission in mission_rows
-        if str(mission.get("status", "")).lower() != "completed"
-    ]
-    completed_missions = [
-        to_mission(mission)
-        for mission in mission_rows
-        if str(mission.get("status", "")).lower() == "completed"
-    ]
+        priority = item.get("priority", "low")
+        status = item.get("status", "pending")
+        mission = {
+            "id": str(item.get("id")),
+            "priority": priority_label(priority) or _priority_to_ui(priority),
+            "target": (int(target.get("x", 0)), int(target.get("y", 0))),
+            "status": mission_status(status) or _mission_status_to_ui(status),
+            "assigned_robot": str(assigned_robot) if assigned_robot is not None else None,
+        }
+        if mission["status"] == "COMPLETED":
+            completed_missions.append(mission)
+        else:
+            active_missions.append(mission)
 
     obstacles = [
         (int(obstacle.get("x", 0)), int(obstacle.get("y", 0)))
@@ -129,34 +248,35 @@ def _convert_simulation_state(payload: dict, step: int) -> SimulationState:
         for station in payload.get("charging_stations", [])
     ]
 
-    return SimulationState(
-        step=step,
-        robots=robots,
-        grid=MapGrid(
-            width=SIM_GRID_SIZE,
-            height=SIM_GRID_SIZE,
-            obstacles=obstacles,
-            charging_stations=charging_stations,
-        ),
-        active_missions=active_missions,
-        completed_missions=completed_missions,
+    return SimulationState.model_validate(
+        {
+            "step": step,
+            "robots": robots,
+            "grid": {
+                "width": SIM_GRID_SIZE,
+                "height": SIM_GRID_SIZE,
+                "obstacles": obstacles,
+                "charging_stations": charging_stations,
+            },
+            "active_missions": active_missions,
+            "completed_missions": completed_missions,
+        }
     )
 
 
 async def _fetch_simulator_state() -> Optional[dict]:
     url = f"{SIMULATOR_BASE_URL}/simulation/state"
 
-    def fetch_sync() -> dict:
-        with urlrequest.urlopen(url, timeout=4) as response:
-            body = response.read().decode("utf-8")
-            return json.loads(body)
-
     try:
-        return await asyncio.to_thread(fetch_sync)
-    except error.URLError as exc:
-        logger.warning("Simulator fetch failed (%s): %s", url, exc)
-    except TimeoutError:
+        response = await simulator_client.get("/simulation/state")
+        response.raise_for_status()
+        return orjson.loads(response.content)
+    except httpx.TimeoutException:
         logger.warning("Simulator fetch timed out (%s)", url)
+    except httpx.HTTPError as exc:
+        logger.warning("Simulator fetch failed (%s): %s", url, exc)
+    except orjson.JSONDecodeError as exc:
+        logger.warning("Simulator returned invalid JSON (%s): %s", url, exc)
     except Exception as exc:
         logger.error("Unexpected simulator fetch error: %s", exc)
     return None
@@ -165,40 +285,178 @@ async def _fetch_simulator_state() -> Optional[dict]:
 async def _poll_simulation_forever() -> None:
     logger.info("Simulation poller started against %s", SIMULATOR_BASE_URL)
     step = 0
+    last_payload: Optional[dict] = None
     while True:
         payload = await _fetch_simulator_state()
         if payload is not None:
+            # The simulator stamps every tick even when nothing moved, so compare the
+            # rest of the payload and skip conversion and publishing (and with
+            # it the SSE send) when nothing actually changed.
+            payload.pop("timestamp", None)
+            if payload == last_payload:
+                await asyncio.sleep(SIM_POLL_INTERVAL_SECONDS)
+                continue
+            last_payload = payload
             step += 1
             converted = _convert_simulation_state(payload, step)
             metrics = payload.get("metrics") or {}
-            async with state_lock:
-                global current_state
-                current_state = converted
-                latest_simulator_metrics["avg_completion_time"] = float(
-                    metrics.get("avg_completion_time", 0.0)
-                )
-                latest_simulator_metrics["total_distance_traveled"] = float(
-                    metrics.get("total_distance_traveled", 0.0)
-                )
+            _publish_state(
+                converted,
+                {
+                    "avg_completion_time": float(metrics.get("avg_completion_time", 0.0)),
+                    "total_distance_traveled": float(
+                        metrics.get("total_distance_traveled", 0.0)
+                    ),
+                },
+            )
         await asyncio.sleep(SIM_POLL_INTERVAL_SECONDS)
 
 
+async def _resolve_ai_batch(
+    batch: List[Tuple[SimulationState, asyncio.Future]],
+) -> None:
+    try:
+        # Requests for the same state object (e.g. several tabs deciding on the
+        # latest snapshot) share a single Gemini call.
+        unique_states: Dict[int, SimulationState] = {}
+        for state, _ in batch:
+            unique_states.setdefault(id(state), state)
+
+        # Submit every call before awaiting any of them.
+        results = await asyncio.gather(
+            *(make_decision(state) for state in unique_states.values()),
+            return_exceptions=True,
+        )
+        decisions = dict(zip(unique_states, results))
+
+        for state, future in batch:
+            if future.done():
+                continue
+            result = decisions[id(state)]
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+    finally:
+        # Only reached with unresolved futures when cancelled on shutdown.
+        for _, future in batch:
+            future.cancel()
+
+
+async def _batch_ai_decisions_forever() -> None:
+    loop = asyncio.get_running_loop()
+    in_flight: Set[asyncio.Task] = set()
+    batch: List[Tuple[SimulationState, asyncio.Future]] = []
+    try:
+        while True:
+            batch = [await ai_request_queue.get()]
+            deadline = loop.time() + AI_BATCH_WINDOW_SECONDS
+            while (remaining := deadline - loop.time()) > 0:
+                try:
+                    batch.append(await asyncio.wait_for(ai_request_queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # Resolve the batch in its own task so requests arriving during a
+            # slow Gemini call start the next window instead of waiting.
+            task = asyncio.create_task(_resolve_ai_batch(batch))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+            batch = []
+    finally:
+        # Fail every request still waiting so no caller hangs on shutdown.
+        for task in in_flight:
+            task.cancel()
+        for _, future in batch:
+            future.cancel()
+        while not ai_request_queue.empty():
+            _, future = ai_request_queue.get_nowait()
+            future.cancel()
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+
+async def _request_decision(state: SimulationState) -> Optional[Decision]:
+    if ai_request_queue is None or ai_batcher_task is None or ai_batcher_task.done():
+        raise HTTPException(status_code=503, detail="AI decision service unavailable")
+    future = asyncio.get_running_loop().create_future()
+    ai_request_queue.put_nowait((state, future))
+    try:
+        return await asyncio.wait_for(future, AI_DECISION_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        logger.error("AI decision timed out after %ss", AI_DECISION_TIMEOUT_SECONDS)
+        return None
+
+
+def _write_ai_log_entries(handle, entries: List[dict]) -> None:
+    try:
+        handle.writelines(json.dumps(entry) + "\n" for entry in entries)
+        handle.flush()
+    except (IOError, OSError) as exc:
+        logger.error("Failed to write AI decision log: %s", exc)
+
+
+async def _write_ai_log_forever() -> None:
+    try:
+        handle = open(AI_LOG_PATH, "a", encoding="utf-8", buffering=1 << 16)
+    except (IOError, OSError) as exc:
+        logger.error("Failed to open AI decision log: %s", exc)
+        return
+
+    with handle:
+        try:
+            while True:
+                entries = [await ai_log_queue.get()]
+                while len(entries) < AI_LOG_MAX_BATCH and not ai_log_queue.empty():
+                    entries.append(ai_log_queue.get_nowait())
+                _write_ai_log_entries(handle, entries)
+                # Let entries pile up between flushes; anything still queued
+                # on shutdown is written by the finally block below.
+                await asyncio.sleep(AI_LOG_FLUSH_INTERVAL_SECONDS)
+        finally:
+            pending = []
+            while not ai_log_queue.empty():
+                pending.append(ai_log_queue.get_nowait())
+            if pending:
+                _write_ai_log_entries(handle, pending)
+
+
+def _log_task_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(
+            "Background task %s failed", task.get_name(), exc_info=task.exception()
+        )
+
+
 @asynccontextmanager
 async def lifespan(_: FastAPI):
-    global poller_task
-    poller_task = asyncio.create_task(_poll_simulation_forever())
+    global poller_task, ai_batcher_task, ai_log_task, simulator_client
+    global ai_request_queue, ai_log_queue
+    simulator_client = httpx.AsyncClient(base_url=SIMULATOR_BASE_URL, timeout=4.0)
+    ai_request_queue = asyncio.Queue()
+    ai_log_queue = asyncio.Queue(maxsize=1000)
+    poller_task = asyncio.create_task(_poll_simulation_forever(), name="simulation-poller")
+    ai_batcher_task = asyncio.create_task(_batch_ai_decisions_forever(), name="ai-batcher")
+    ai_log_task = asyncio.create_task(_write_ai_log_forever(), name="ai-log-writer")
+    for task in (poller_task, ai_batcher_task, ai_log_task):
+        task.add_done_callback(_log_task_failure)
     try:
         yield
     finally:
-        if poller_task:
-            poller_task.cancel()
-            try:
-                await poller_task
-            except asyncio.CancelledError:
-                pass
+        for task in (poller_task, ai_batcher_task, ai_log_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+                except Exception:
+                    # Already logged by _log_task_failure.
+                    pass
+        await simulator_client.aclose()
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 allowed_origins = _parse_allowed_origins()
 app.add_middleware(
@@ -221,26 +479,56 @@ def read_root():
 @app.get("/api/v1/stream")
 async def stream_simulation_state(request: Request):
     async def event_generator():
+        last_version = -1
         while True:
             if await request.is_disconnected():
                 logger.info("Client disconnected from stream")
                 break
 
-            async with state_lock:
-                payload = current_state.model_dump_json()
-
-            yield {"event": "update", "data": payload}
-            await asyncio.sleep(1)
+            # Grab the event before reading the snapshot so a publish that
+            # lands while we are yielding still wakes the wait below.
+            changed = state_changed
+            snapshot = current_snapshot
+            if snapshot.version != last_version:
+                last_version = snapshot.version
+                yield {"event": "update", "data": snapshot.state_json}
+            try:
+                await asyncio.wait_for(changed.wait(), SSE_DISCONNECT_CHECK_SECONDS)
+            except asyncio.TimeoutError:
+                pass
 
     return EventSourceResponse(event_generator())
 
 
+def _apply_completed_delta(update: SimulationStateUpdate) -> SimulationState:
+    # A full completed list is authoritative; otherwise the delta is appended
+    # to what we already have, unless the step went backwards (sender restart).
+    previous = current_snapshot.state
+    if "completed_missions" in update.model_fields_set or update.step < previous.step:
+        completed = list(update.completed_missions)
+    else:
+        completed = list(previous.completed_missions)
+    # Senders retry deltas whose post failed, even if it was applied before
+    # the failure, so skip missions that are already recorded.
+    seen_ids = {mission.id for mission in completed}
+    for mission in update.completed_delta:
+        if mission.id not in seen_ids:
+            seen_ids.add(mission.id)
+            completed.append(mission)
+    return SimulationState(
+        step=update.step,
+        robots=update.robots,
+        grid=update.grid,
+        active_missions=update.active_missions,
+        completed_missions=completed,
+    )
+
+
 @app.post("/api/v1/update")
-async def update_simulation_state(state: SimulationState):
+async def update_simulation_state(update: SimulationStateUpdate):
     try:
-        global current_state
-        async with state_lock:
-            current_state = state
+        state = _apply_completed_delta(update)
+        _publish_state(state)
         logger.info("Received manual state update for step %s", state.step)
         return {"status": "received", "step": state.step}
     except Exception as exc:
@@ -248,39 +536,56 @@ async def update_simulation_state(state: SimulationState):
         raise HTTPException(status_code=500, detail="Internal Server Error")
 
 
+def _log_ai_decision(step: int, decision: Decision) -> None:
+    if ai_log_queue is None or ai_log_task is None or ai_log_task.done():
+        logger.error("AI decision log writer is not running; dropping entry for step %s", step)
+        return
+    try:
+        ai_log_queue.put_nowait({"step": step, "decision": decision.model_dump()})
+    except asyncio.QueueFull:
+        logger.error("AI decision log queue is full; dropping entry for step %s", step)
+
+
 @app.post("/api/v1/ai/decide")
-def get_ai_decision():
-    if not current_state.robots:
+async def get_ai_decision():
+    state = current_snapshot.state
+    if not state.robots:
         raise HTTPException(
             status_code=400, detail="No simulation state available: no robots in state"
         )
 
-    decision = make_decision(current_state)
+    decision = await _request_decision(state)
 
     if not decision:
         raise HTTPException(status_code=500, detail="AI Decision failed")
 
-    try:
-        log_entry = {"step": current_state.step, "decision": decision.model_dump()}
-        with open("logs/ai_decisions.jsonl", "a", encoding="utf-8") as handle:
-            handle.write(json.dumps(log_entry) + "\n")
-    except (IOError, OSError) as exc:
-        logger.error("Failed to write AI decision log: %s", exc)
-
+    _log_ai_decision(state.step, decision)
     return decision
 
 
+@app.post("/api/v1/ai/decide_many", response_model=List[Optional[Decision]])
+async def get_ai_decisions(states: List[SimulationState]):
+    if not states:
+        raise HTTPException(status_code=400, detail="No simulation states provided")
+
+    decisions = await asyncio.gather(*(_request_decision(state) for state in states))
+
+    for state, decision in zip(states, decisions):
+        if decision:
+            _log_ai_decision(state.step, decision)
+    return decisions
+
+
 @app.get("/api/v1/state", response_model=SimulationState)
 async def get_simulation_state():
-    async with state_lock:
-        return current_state
+    # The snapshot already carries its serialized form; send it as-is.
+    return Response(content=current_snapshot.state_json, media_type="application/json")
 
 
 @app.get("/api/v1/robots", response_model=List[RobotState])
 async def get_robots():
     try:
-        async with state_lock:
-            return current_state.robots
+        return current_snapshot.state.robots
     except Exception as exc:
         logger.error("Error fetching robots: %s", exc)
         raise HTTPException(status_code=500, detail="Internal Server Error")
@@ -289,8 +594,7 @@ async def get_robots():
 @app.get("/api/v1/missions", response_model=List[Mission])
 async def get_missions():
     try:
-        async with state_lock:
-            return current_state.active_missions
+        return current_snapshot.state.active_missions
     except Exception as exc:
         logger.error("Error fetching missions: %s", exc)
         raise HTTPException(status_code=500, detail="Internal Server Error")
@@ -299,16 +603,17 @@ async def get_missions():
 @app.get("/api/v1/metrics", response_model=Metrics)
 async def get_metrics():
     try:
-        async with state_lock:
-            robots = list(current_state.robots)
-            completed_count = len(current_state.completed_missions)
-            simulator_metrics = dict(latest_simulator_metrics)
-
-        active_count = sum(1 for robot in robots if robot.status != "DEAD")
-        current_total_battery = sum(max(0.0, min(100.0, robot.battery)) for robot in robots)
-        baseline_total_battery = len(robots) * 100.0
+        snapshot = current_snapshot
+        fleet = snapshot.fleet
+        completed_count = len(snapshot.state.completed_missions)
+        simulator_metrics = snapshot.simulator_metrics
+
+        robot_count = fleet.robot_count
+        active_count = fleet.active_count
+        current_total_battery = fleet.total_battery
+        baseline_total_battery = robot_count * 100.0
         total_used = max(0.0, baseline_total_battery - current_total_battery)
-        fleet_battery = current_total_battery / len(robots) if robots else 0.0
+        fleet_battery = current_total_battery / robot_count if robot_count else 0.0
 
         return Metrics(
             active_robots=active_count,
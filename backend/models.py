@@ -1,8 +1,14 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import List, Tuple, Optional
 
+# Published snapshots are shared across requests without a lock, so the state
+# models are immutable.
+_SNAPSHOT_CONFIG = ConfigDict(frozen=True)
+
 
 class RobotState(BaseModel):
+    model_config = _SNAPSHOT_CONFIG
+
     id: str
     position: Tuple[int, int]
     battery: float
@@ -11,6 +17,8 @@ class RobotState(BaseModel):
 
 
 class MapGrid(BaseModel):
+    model_config = _SNAPSHOT_CONFIG
+
     width: int
     height: int
     obstacles: List[Tuple[int, int]]
@@ -18,6 +26,8 @@ class MapGrid(BaseModel):
 
 
 class Mission(BaseModel):
+    model_config = _SNAPSHOT_CONFIG
+
     id: str
     priority: str  # "High", "Medium", "Low"
     target: Tuple[int, int]
@@ -35,8 +45,22 @@ class Metrics(BaseModel):
 
 
 class SimulationState(BaseModel):
+    model_config = _SNAPSHOT_CONFIG
+
     step: int
     robots: List[RobotState]
     grid: MapGrid
     active_missions: List[Mission]
     completed_missions: List[Mission] = []
+
+
+class SimulationStateUpdate(SimulationState):
+    """State pushed to /api/v1/update.
+
+    Senders may omit ``completed_missions`` and instead list only the missions
+    completed since their last accepted update in ``completed_delta``. A delta
+    may be resent after a failed or timed-out post, so the backend applies it
+    at most once per mission id.
+    """
+
+    completed_delta: List[Mission] = []
@@ -7,22 +7,17 @@ the backend API app from `../backend/main.py`.
 
 from __future__ import annotations
 
-import importlib.util
 import sys
 from pathlib import Path
 
-BASE_DIR = Path(__file__).resolve().parent
-BACKEND_DIR = BASE_DIR.parent / "backend"
-BACKEND_MAIN = BACKEND_DIR / "main.py"
+REPO_ROOT = Path(__file__).resolve().parent.parent
 
-if str(BACKEND_DIR) not in sys.path:
-    sys.path.insert(0, str(BACKEND_DIR))
+# `backend` is imported as a package from the repo root; its modules import
+# their siblings relatively, so the backend directory itself stays off
+# sys.path and every backend module has a single identity.
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
 
-spec = importlib.util.spec_from_file_location("rescueroute_backend_main", BACKEND_MAIN)
-if spec is None or spec.loader is None:
-    raise RuntimeError(f"Unable to load backend app from {BACKEND_MAIN}")
+from backend.main import app  # noqa: E402
 
-module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(module)
-
-app = module.app
+__all__ = ["app"]
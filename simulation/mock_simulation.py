@@ -1,99 +1,206 @@
+import orjson
+import queue
 import requests
+import threading
 import time
 import random
+from array import array
+from collections import deque
+
+from requests.adapters import HTTPAdapter
 
 
 API_URL = "http://localhost:8000/api/v1/update"
+API_TIMEOUT_SECONDS = 0.5
+TICK_SECONDS = 1.0
+COMPLETED_HISTORY = 1000  # completed missions kept locally / awaiting delivery
+JSON_HEADERS = {"Content-Type": "application/json"}
 
 # Configuration
 GRID_WIDTH = 10
 GRID_HEIGHT = 10
 CHARGING_STATIONS = [[0, 0], [9, 9]]
 OBSTACLES = [[2, 2], [3, 3], [4, 4], [5, 5], [5, 6]]
+LOW_BATTERY_THRESHOLD = 30  # % below which robots head for a charger
+DEAD_RECOVERY_STEPS = 3  # ticks a dead robot waits before reviving
+
+
+def _cell_bits(cells):
+    """Bitmap with bit ``y * GRID_WIDTH + x`` set for every listed cell."""
+    bits = 0
+    for x, y in cells:
+        bits |= 1 << (y * GRID_WIDTH + x)
+    return bits
+
+
+# Bitmaps for membership tests (``bits >> (y * GRID_WIDTH + x) & 1``); the
+# lists above are kept for the JSON payload.
+OBSTACLES_BITS = _cell_bits(OBSTACLES)
+CHARGING_BITS = _cell_bits(CHARGING_STATIONS)
+
+# Cells a mission may target: anything that is neither an obstacle nor a
+# charging station.
+VALID_TARGET_CELLS = [
+    (x, y)
+    for x in range(GRID_WIDTH)
+    for y in range(GRID_HEIGHT)
+    if not (OBSTACLES_BITS | CHARGING_BITS) >> (y * GRID_WIDTH + x) & 1
+]
+
+MISSION_PRIORITIES = ("High", "Medium", "Low")
+
+# Private generator with its methods bound once; seed it via _rng.seed().
+_rng = random.Random()
+_random = _rng.random
+_choice = _rng.choice
+
+_CELL_COUNT = GRID_WIDTH * GRID_HEIGHT
+
+# The map never changes, so its JSON is encoded once and spliced into every
+# payload as a pre-serialized fragment.
+_GRID_STATIC = {
+    "width": GRID_WIDTH,
+    "height": GRID_HEIGHT,
+    "obstacles": OBSTACLES,
+    "charging_stations": CHARGING_STATIONS,
+}
+_GRID_FRAGMENT = orjson.Fragment(orjson.dumps(_GRID_STATIC))
+
+
+def _build_next_step_table():
+    """BFS outward from every free cell over the static grid.
+
+    Entry ``(src * _CELL_COUNT + dst) * 2`` holds the x, y of the first cell on
+    a shortest path from ``src`` to ``dst`` (cells indexed ``y * GRID_WIDTH + x``),
+    or -1, -1 when ``dst`` cannot be reached.
+    """
+    table = array("b", [-1]) * (_CELL_COUNT * _CELL_COUNT * 2)
+    for ty in range(GRID_HEIGHT):
+        for tx in range(GRID_WIDTH):
+            dst = ty * GRID_WIDTH + tx
+            if OBSTACLES_BITS >> dst & 1:
+                continue
+            seen = {(tx, ty)}
+            queue = deque(seen)
+            while queue:
+                cx, cy = queue.popleft()
+                for nx, ny in ((cx + 1, cy), (cx - 1, cy), (cx, cy + 1), (cx, cy - 1)):
+                    if (
+                        0 <= nx < GRID_WIDTH
+                        and 0 <= ny < GRID_HEIGHT
+                        and not OBSTACLES_BITS >> (ny * GRID_WIDTH + nx) & 1
+                        and (nx, ny) not in seen
+                    ):
+                        seen.add((nx, ny))
+                        # Searching outward from the target, the way back from
+                        # the neighbour is the cell we reached it from.
+                        offset = ((ny * GRID_WIDTH + nx) * _CELL_COUNT + dst) * 2
+                        table[offset] = cx
+                        table[offset + 1] = cy
+                        queue.append((nx, ny))
+    return table
+
+
+# Grid and obstacles are static, so pathfinding is done once at import (~20 KB).
+NEXT_STEP = _build_next_step_table()
+
+
+def next_step(x, y, tx, ty):
+    """First cell on a shortest path from (x, y) to (tx, ty), or None."""
+    offset = ((y * GRID_WIDTH + x) * _CELL_COUNT + ty * GRID_WIDTH + tx) * 2
+    x = NEXT_STEP[offset]
+    if x < 0:
+        return None
+    return x, NEXT_STEP[offset + 1]
+
+
+# Closest charging station (Manhattan distance, first listed wins ties) for
+# every cell, indexed by y * GRID_WIDTH + x.
+NEAREST_CHARGER = tuple(
+    tuple(
+        min(CHARGING_STATIONS, key=lambda cs: abs(cs[0] - x) + abs(cs[1] - y))
+    )
+    for y in range(GRID_HEIGHT)
+    for x in range(GRID_WIDTH)
+)
 
 
 class Robot:
+    # Coordinates are plain ints (tx/ty are None without a target); the
+    # [x, y] list only exists in the JSON payload.
+    __slots__ = (
+        "id",
+        "x",
+        "y",
+        "battery",
+        "status",
+        "current_mission",
+        "tx",
+        "ty",
+        "dead_timer",
+        "start_x",
+        "start_y",
+        "_state",
+    )
+
     def __init__(self, id, start_pos):
         self.id = id
-        self.start_pos = list(start_pos)
-        self.position = list(start_pos)
+        self.start_x, self.start_y = start_pos
+        self.x, self.y = start_pos
         self.battery = 100.0
         self.status = "IDLE"  # IDLE, MOVING, CHARGING, DEAD
         self.current_mission = None
-        self.target = None
+        self.tx = self.ty = None
         self.dead_timer = 0
+        # Payload entry reused every tick; it is serialized before the next
+        # update touches it.
+        self._state = {
+            "id": id,
+            "position": [self.x, self.y],
+            "battery": None,
+            "status": None,
+            "current_mission": None,
+        }
 
-    def move_towards(self, target):
+    def move_towards(self, tx, ty):
         if self.battery <= 0:
             self.status = "DEAD"
             return
 
-        dx = target[0] - self.position[0]
-        dy = target[1] - self.position[1]
-
-        move_x = 0
-        move_y = 0
-
-        if dx != 0:
-            move_x = 1 if dx > 0 else -1
-        elif dy != 0:
-            move_y = 1 if dy > 0 else -1
+        step = next_step(self.x, self.y, tx, ty)
+        if step is None:
+            print(f"Robot {self.id} has no route to {tx}, {ty}. Holding position.")
+            return
 
-        new_x = self.position[0] + move_x
-        new_y = self.position[1] + move_y
-
-        # Check boundaries and obstacles
-        if (
-            0 <= new_x < GRID_WIDTH
-            and 0 <= new_y < GRID_HEIGHT
-            and [new_x, new_y] not in OBSTACLES
-        ):
-            self.position = [new_x, new_y]
-            self.battery -= 2.0
-            self.status = "MOVING"
-        else:
-            # Blocked logic (scenario 1)
-            print(f"Robot {self.id} path blocked at {new_x}, {new_y}. Rerouting...")
-            # Simple reroute: try perpendicular move
-            if move_x != 0:
-                self.position[1] = min(max(0, self.position[1] + 1), GRID_HEIGHT - 1)
-            else:
-                self.position[0] = min(max(0, self.position[0] + 1), GRID_WIDTH - 1)
-            self.battery -= 2.0
+        self.x, self.y = step
+        self.battery -= 2.0
+        self.status = "MOVING"
 
     def update(self):
-        # Dead robot recovery: after 3 steps, revive with minimal battery
+        # Dead robot recovery: after DEAD_RECOVERY_STEPS, revive with minimal battery
         if self.status == "DEAD":
             self.dead_timer += 1
-            if self.dead_timer >= 3:
+            if self.dead_timer >= DEAD_RECOVERY_STEPS:
                 self.battery = 5.0
                 self.dead_timer = 0
-                self.position = list(self.start_pos)
+                self.x, self.y = self.start_x, self.start_y
                 # Release any orphaned mission
                 if self.current_mission:
                     self.current_mission["status"] = "PENDING"
                     self.current_mission["assigned_robot"] = None
                     self.current_mission = None
                 # Head to nearest charging station
-                closest_cs = min(
-                    CHARGING_STATIONS,
-                    key=lambda cs: abs(cs[0] - self.position[0])
-                    + abs(cs[1] - self.position[1]),
-                )
-                self.target = closest_cs
+                closest_cs = NEAREST_CHARGER[self.y * GRID_WIDTH + self.x]
+                self.tx, self.ty = closest_cs
                 self.status = "MOVING"
                 print(f"Robot {self.id} recovered! Heading to charging station.")
             return
 
-        # Low battery: return to charge at 30% threshold
-        if self.battery < 30 and self.status not in ("CHARGING", "DEAD"):
+        # Low battery: return to charge below LOW_BATTERY_THRESHOLD
+        if self.battery < LOW_BATTERY_THRESHOLD and self.status not in ("CHARGING", "DEAD"):
             # Find closest charging station
-            closest_cs = min(
-                CHARGING_STATIONS,
-                key=lambda cs: abs(cs[0] - self.position[0])
-                + abs(cs[1] - self.position[1]),
-            )
-            self.target = closest_cs
+            closest_cs = NEAREST_CHARGER[self.y * GRID_WIDTH + self.x]
+            self.tx, self.ty = closest_cs
             self.status = "MOVING"
             if self.current_mission:
                 self.current_mission["status"] = "PENDING"
@@ -107,12 +214,12 @@ class Robot:
             self.battery = min(100, self.battery + 10)
             if self.battery >= 100:
                 self.status = "IDLE"
-                self.target = None
+                self.tx = self.ty = None
             return
 
-        if self.target:
-            if self.position == self.target:
-                if self.battery < 100 and self.position in CHARGING_STATIONS:
+        if self.tx is not None:
+            if self.x == self.tx and self.y == self.ty:
+                if self.battery < 100 and CHARGING_BITS >> (self.y * GRID_WIDTH + self.x) & 1:
                     self.status = "CHARGING"
                 elif self.current_mission:
                     print(
@@ -121,68 +228,150 @@ class Robot:
                     self.status = "IDLE"
                     self.current_mission["status"] = "COMPLETED"
                     completed_missions.append(self.current_mission)
-                    if self.current_mission in active_missions:
-                        active_missions.remove(self.current_mission)
+                    completed_since_last_push.append(self.current_mission)
+                    active_missions.pop(self.current_mission["id"], None)
                     self.current_mission = None
-                    self.target = None
+                    self.tx = self.ty = None
             else:
-                self.move_towards(self.target)
+                self.move_towards(self.tx, self.ty)
 
 
 robots = [Robot("R1", [0, 0]), Robot("R2", [9, 0]), Robot("R3", [0, 9])]
 
-active_missions = []
-completed_missions = []
+# Keyed by mission id; dicts keep insertion order, so the payload lists
+# missions oldest first as before.
+active_missions = {}
+# Completed missions are only sent once, as the payload's "completed_delta";
+# the backend appends them to its own list. The local history is bounded.
+completed_missions = deque(maxlen=COMPLETED_HISTORY)
+completed_since_last_push = []
 mission_counter = 1
 
 
 def generate_mission():
     global mission_counter
-    if len(active_missions) < 5 and random.random() < 0.3:
-        target = [random.randint(0, GRID_WIDTH - 1), random.randint(0, GRID_HEIGHT - 1)]
-        while target in OBSTACLES or target in CHARGING_STATIONS:
-            target = [
-                random.randint(0, GRID_WIDTH - 1),
-                random.randint(0, GRID_HEIGHT - 1),
-            ]
+    if len(active_missions) < 5 and _random() < 0.3:
+        target = list(_choice(VALID_TARGET_CELLS))
 
         mission = {
             "id": f"M{mission_counter:03d}",
-            "priority": random.choice(["High", "Medium", "Low"]),
+            "priority": _choice(MISSION_PRIORITIES),
             "target": target,
             "status": "PENDING",
             "assigned_robot": None,
         }
-        active_missions.append(mission)
+        active_missions[mission["id"]] = mission
         print(f"New Mission Generated: {mission['id']} at {mission['target']}")
         mission_counter += 1
 
 
+def _assign(robot, mission):
+    robot.current_mission = mission
+    robot.tx, robot.ty = mission["target"]
+    robot.status = "MOVING"
+    mission["status"] = "IN_PROGRESS"
+    mission["assigned_robot"] = robot.id
+    print(f"Assigned Mission {mission['id']} to {robot.id}")
+
+
 def assign_missions():
-    for mission in active_missions:
-        if mission["status"] == "PENDING":
-            # Find available robot (not dead, not charging, idle)
-            available_robots = [
-                r for r in robots if r.status == "IDLE" and r.battery > 30
-            ]
-            if available_robots:
-                # Assign to closest robot
-                best_robot = min(
-                    available_robots,
-                    key=lambda r: abs(r.position[0] - mission["target"][0])
-                    + abs(r.position[1] - mission["target"][1]),
+    pending = [m for m in active_missions.values() if m["status"] == "PENDING"]
+    if not pending:
+        return
+    # Find available robots (not dead, not charging, idle)
+    available_robots = [
+        r for r in robots if r.status == "IDLE" and r.battery >= LOW_BATTERY_THRESHOLD
+    ]
+    if not available_robots:
+        return
+
+    for mission in pending:
+        if not available_robots:
+            break
+        # Assign to closest robot (first one wins ties, as with min())
+        tx, ty = mission["target"]
+        best_robot = None
+        best_distance = 1 << 30
+        for r in available_robots:
+            distance = abs(r.x - tx) + abs(r.y - ty)
+            if distance < best_distance:
+                best_distance = distance
+                best_robot = r
+        available_robots.remove(best_robot)
+        _assign(best_robot, mission)
+
+
+def _enqueue_latest(updates, item):
+    # Drop the oldest pending update rather than blocking the tick loop; its
+    # completed missions are carried over to the newer one.
+    try:
+        updates.put_nowait(item)
+    except queue.Full:
+        try:
+            dropped = updates.get_nowait()
+        except queue.Empty:
+            dropped = None
+        if dropped is not None and item is not None:
+            step, body, delta = item
+            item = (step, body, dropped[2] + delta)
+        updates.put_nowait(item)
+
+
+def _with_completed_delta(body, delta):
+    # body is an encoded JSON object; append the delta as its last key.
+    return body[:-1] + b',"completed_delta":' + orjson.dumps(delta) + b"}"
+
+
+def _post_updates(updates):
+    # One keep-alive connection reused for every tick.
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    # Completed missions not yet acknowledged by the backend; resent with the
+    # next update until a post succeeds.
+    unsent = []
+    try:
+        while True:
+            item = updates.get()
+            # If the backend is slow and updates piled up, only send the newest.
+            while item is not None and not updates.empty():
+                unsent.extend(item[2])
+                item = updates.get_nowait()
+            if item is None:
+                return
+
+            step, body, delta = item
+            unsent.extend(delta)
+            del unsent[:-COMPLETED_HISTORY]
+            try:
+                response = session.post(
+                    API_URL,
+                    data=_with_completed_delta(body, unsent),
+                    headers=JSON_HEADERS,
+                    timeout=API_TIMEOUT_SECONDS,
                 )
-                best_robot.current_mission = mission
-                best_robot.target = mission["target"]
-                best_robot.status = "MOVING"
-                mission["status"] = "IN_PROGRESS"
-                mission["assigned_robot"] = best_robot.id
-                print(f"Assigned Mission {mission['id']} to {best_robot.id}")
+                if response.status_code == 200:
+                    unsent.clear()
+                else:
+                    print(
+                        f"Step {step}: Failed {response.status_code} - {response.text}"
+                    )
+            except Exception as e:
+                print(f"Connection error: {e}")
+    finally:
+        session.close()
 
 
 def run_mock_simulation():
     step = 0
     print(f"Starting detailed mock simulation, pushing to {API_URL}...")
+    # Posting happens on a background thread so the tick rate does not depend
+    # on backend latency.
+    updates = queue.Queue(maxsize=2)
+    poster = threading.Thread(target=_post_updates, args=(updates,), daemon=True)
+    poster.start()
+    next_deadline = time.monotonic()
     try:
         while True:
             generate_mission()
@@ -191,44 +380,45 @@ def run_mock_simulation():
             robot_states = []
             for r in robots:
                 r.update()
-                robot_states.append(
-                    {
-                        "id": r.id,
-                        "position": r.position,
-                        "battery": r.battery,
-                        "status": r.status,
-                        "current_mission": r.current_mission["id"]
-                        if r.current_mission
-                        else None,
-                    }
+                robot_state = r._state
+                position = robot_state["position"]
+                position[0] = r.x
+                position[1] = r.y
+                robot_state["battery"] = r.battery
+                robot_state["status"] = r.status
+                robot_state["current_mission"] = (
+                    r.current_mission["id"] if r.current_mission else None
                 )
+                robot_states.append(robot_state)
 
             state = {
                 "step": step,
                 "robots": robot_states,
-                "grid": {
-                    "width": GRID_WIDTH,
-                    "height": GRID_HEIGHT,
-                    "obstacles": OBSTACLES,
-                    "charging_stations": CHARGING_STATIONS,
-                },
-                "active_missions": active_missions,
-                "completed_missions": completed_missions,
+                "grid": _GRID_FRAGMENT,
+                "active_missions": list(active_missions.values()),
             }
 
-            try:
-                response = requests.post(API_URL, json=state)
-                if response.status_code != 200:
-                    print(
-                        f"Step {step}: Failed {response.status_code} - {response.text}"
-                    )
-            except Exception as e:
-                print(f"Connection error: {e}")
+            # Serialize here: the state shares lists and dicts that the next
+            # tick mutates, so the poster thread only ever sees bytes. The
+            # completed missions themselves are never modified again.
+            delta = completed_since_last_push[:]
+            completed_since_last_push.clear()
+            _enqueue_latest(updates, (step, orjson.dumps(state), delta))
 
             step += 1
-            time.sleep(1)
+            # Sleep to an absolute deadline so tick work doesn't add drift;
+            # if a tick overran, start the schedule again from now.
+            next_deadline += TICK_SECONDS
+            delay = next_deadline - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_deadline = time.monotonic()
     except KeyboardInterrupt:
         print("Stopping mock simulation.")
+    finally:
+        _enqueue_latest(updates, None)
+        poster.join(timeout=API_TIMEOUT_SECONDS * 2)
 
 
 if __name__ == "__main__":
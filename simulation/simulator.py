@@ -3,11 +3,13 @@ RescueRoute AI - Production disaster response simulator.
 """
 
 import asyncio
+import functools
 import heapq
 import logging
 import os
 import random
 import time
+from collections import deque
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from typing import Optional
@@ -28,8 +30,23 @@ BATTERY_DRAIN_PER_MOVE = 2.0
 BATTERY_CHARGE_PER_TICK = 10.0
 LOW_BATTERY_THRESHOLD = 20.0
 MIN_BATTERY_FOR_MISSION = 50.0
+
+# Robots track battery as an int in tenths of a percent (1000 == 100%); every
+# drain and charge step is a whole number of tenths, so no float math or
+# rounding is needed per tick.
+BATTERY_SCALE = 10
+_BATTERY_FULL = 100 * BATTERY_SCALE
+_BATTERY_DRAIN_PER_MOVE = round(BATTERY_DRAIN_PER_MOVE * BATTERY_SCALE)
+_BATTERY_CHARGE_PER_TICK = round(BATTERY_CHARGE_PER_TICK * BATTERY_SCALE)
+_LOW_BATTERY_THRESHOLD = round(LOW_BATTERY_THRESHOLD * BATTERY_SCALE)
+_MIN_BATTERY_FOR_MISSION = round(MIN_BATTERY_FOR_MISSION * BATTERY_SCALE)
 PRIORITY_SCORES = {"high": 3, "medium": 2, "low": 1}
 
+# Robot statuses are held as small ints in the tick loop; the names are only
+# needed when building API output.
+STATUS_IDLE, STATUS_MOVING, STATUS_CHARGING, STATUS_DEAD = 0, 1, 2, 3
+_STATUS_NAMES = ("idle", "moving", "charging", "dead")
+
 
 class Position(BaseModel):
     x: int
@@ -82,15 +99,29 @@ class SimulationStateOut(BaseModel):
 
 
 class Robot:
+    # Fixed attribute layout: the tick loop reads these fields for every robot
+    # several times per tick.
+    __slots__ = (
+        "id",
+        "x",
+        "y",
+        "battery",
+        "status_code",
+        "mission_id",
+        "path",
+        "total_distance_traveled",
+        "charge_destination",
+    )
+
     def __init__(self, robot_id: int, x: int, y: int) -> None:
         self.id = robot_id
         self.x = x
         self.y = y
-        self.battery = 100.0
-        self.status = "idle"  # idle | moving | charging | dead
+        self.battery = _BATTERY_FULL  # tenths of a percent
+        self.status_code = STATUS_IDLE
         self.mission_id: Optional[int] = None
-        self.path: list[tuple[int, int]] = []
-        self.total_distance_traveled = 0.0
+        self.path: deque[tuple[int, int]] = deque()
+        self.total_distance_traveled = 0
         self.charge_destination: Optional[tuple[int, int]] = None
 
     def to_out(self) -> RobotOut:
@@ -98,31 +129,54 @@ class Robot:
             id=self.id,
             x=self.x,
             y=self.y,
-            battery=round(self.battery, 1),
-            status=self.status,
+            battery=self.battery / BATTERY_SCALE,
+            status=_STATUS_NAMES[self.status_code],
             mission_id=self.mission_id,
         )
 
+    @property
+    def status(self) -> str:
+        return _STATUS_NAMES[self.status_code]
+
 
 class Mission:
+    __slots__ = (
+        "id",
+        "priority",
+        "priority_score",
+        "target_x",
+        "target_y",
+        "status",
+        "assigned_robot",
+        "start_time",
+        "completion_time",
+        "_out",
+    )
+
     def __init__(self, mission_id: int, priority: str, target_x: int, target_y: int) -> None:
         self.id = mission_id
         self.priority = priority
+        self.priority_score = PRIORITY_SCORES.get(priority, 0)
         self.target_x = target_x
         self.target_y = target_y
         self.status = "pending"  # pending | active | completed
         self.assigned_robot: Optional[int] = None
         self.start_time: Optional[float] = None
         self.completion_time: Optional[float] = None
+        self._out: Optional[MissionOut] = None
 
     def to_out(self) -> MissionOut:
-        return MissionOut(
-            id=self.id,
-            priority=self.priority,
-            target=Position(x=self.target_x, y=self.target_y),
-            status=self.status,
-            assigned_robot=self.assigned_robot,
-        )
+        # Missions change rarely; rebuild only when a published field moved.
+        out = self._out
+        if out is None or out.status != self.status or out.assigned_robot != self.assigned_robot:
+            out = self._out = MissionOut(
+                id=self.id,
+                priority=self.priority,
+                target=Position(x=self.target_x, y=self.target_y),
+                status=self.status,
+                assigned_robot=self.assigned_robot,
+            )
+        return out
 
 
 class Obstacle:
@@ -138,57 +192,114 @@ class ChargingStation:
         self.y = y
 
 
+@functools.lru_cache(maxsize=4)
+def _grid_neighbors(grid_size: int) -> tuple[tuple[tuple[int, int, int], ...], ...]:
+    """In-bounds 4-neighbours of every flat cell index, as (index, x, y)."""
+    neighbors = []
+    for y in range(grid_size):
+        for x in range(grid_size):
+            cells = []
+            for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < grid_size and 0 <= ny < grid_size:
+                    cells.append((ny * grid_size + nx, nx, ny))
+            neighbors.append(tuple(cells))
+    return tuple(neighbors)
+
+
+class _AStarScratch:
+    """Per-grid-size search buffers shared by every A* call.
+
+    Entries are only valid where their stamp equals the current call's
+    generation, so starting a new search is O(1) instead of refilling the
+    buffers. Only touched from the simulator's single event-loop thread.
+    """
+
+    def __init__(self, cell_count: int) -> None:
+        self.generation = 0
+        self.g_score = [0] * cell_count
+        self.came_from = [0] * cell_count
+        self.seen = [0] * cell_count  # g_score/came_from valid for this generation
+        self.closed = [0] * cell_count  # expanded in this generation
+
+
+@functools.lru_cache(maxsize=4)
+def _astar_scratch(grid_size: int) -> _AStarScratch:
+    return _AStarScratch(grid_size * grid_size)
+
+
 def astar(
     start: tuple[int, int],
     goal: tuple[int, int],
-    blocked: set[tuple[int, int]],
+    blocked: bytearray,
     grid_size: int = GRID_SIZE,
 ) -> list[tuple[int, int]]:
-    """A* using Manhattan heuristic. Returns full path [start..goal] or empty list if unreachable."""
+    """A* using Manhattan heuristic. Returns full path [start..goal] or empty list if unreachable.
+
+    ``blocked`` is a flat grid: ``blocked[y * grid_size + x]`` is non-zero for
+    obstacle cells. Nodes are tracked as flat indices in reused scratch lists,
+    so the search never hashes coordinate tuples or allocates per-cell state.
+    """
     if start == goal:
         return [start]
-    if goal in blocked:
+    sx, sy = start
+    gx, gy = goal
+    goal_index = gy * grid_size + gx
+    if blocked[goal_index]:
         return []
 
-    def heuristic(a: tuple[int, int], b: tuple[int, int]) -> int:
-        return abs(a[0] - b[0]) + abs(a[1] - b[1])
-
-    open_heap: list[tuple[int, int, tuple[int, int]]] = []
-    heapq.heappush(open_heap, (heuristic(start, goal), 0, start))
-
-    g_score: dict[tuple[int, int], int] = {start: 0}
-    came_from: dict[tuple[int, int], tuple[int, int]] = {}
-    visited: set[tuple[int, int]] = set()
-    directions = ((1, 0), (-1, 0), (0, 1), (0, -1))
+    start_index = sy * grid_size + sx
+    scratch = _astar_scratch(grid_size)
+    scratch.generation += 1
+    generation = scratch.generation
+    g_score = scratch.g_score
+    came_from = scratch.came_from
+    seen = scratch.seen
+    closed = scratch.closed
+    g_score[start_index] = 0
+    seen[start_index] = generation
+
+    neighbors = _grid_neighbors(grid_size)
+    # Per-goal heuristic terms: h(x, y) = h_x[x] + h_y[y], so no abs() per push.
+    h_x = [abs(x - gx) for x in range(grid_size)]
+    h_y = [abs(y - gy) for y in range(grid_size)]
+    # Heap entries are (f, g, cell) packed into one int, so pushes allocate no
+    # tuples and compare as single ints in the same (f, g, cell) order.
+    bits = (grid_size * grid_size).bit_length()
+    g_shift = bits
+    f_shift = 2 * bits
+    field_mask = (1 << bits) - 1
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+    open_heap: list[int] = [((h_x[sx] + h_y[sy]) << f_shift) | start_index]
 
     while open_heap:
-        _, current_g, current = heapq.heappop(open_heap)
-        if current in visited:
+        key = heappop(open_heap)
+        current = key & field_mask
+        current_g = (key >> g_shift) & field_mask
+        if closed[current] == generation:
             continue
-        visited.add(current)
+        closed[current] = generation
 
-        if current == goal:
-            path = [current]
-            while current in came_from:
+        if current == goal_index:
+            path = [goal]
+            while current != start_index:
                 current = came_from[current]
-                path.append(current)
+                y, x = divmod(current, grid_size)
+                path.append((x, y))
             path.reverse()
             return path
 
-        for dx, dy in directions:
-            nx, ny = current[0] + dx, current[1] + dy
-            neighbor = (nx, ny)
-            if not (0 <= nx < grid_size and 0 <= ny < grid_size):
-                continue
-            if neighbor in blocked:
+        tentative_g = current_g + 1
+        for neighbor, nx, ny in neighbors[current]:
+            if blocked[neighbor]:
                 continue
-
-            tentative_g = current_g + 1
-            if tentative_g < g_score.get(neighbor, 10**9):
+            if seen[neighbor] != generation or tentative_g < g_score[neighbor]:
+                seen[neighbor] = generation
                 g_score[neighbor] = tentative_g
                 came_from[neighbor] = current
-                f_score = tentative_g + heuristic(neighbor, goal)
-                heapq.heappush(open_heap, (f_score, tentative_g, neighbor))
+                f_score = tentative_g + h_x[nx] + h_y[ny]
+                heappush(open_heap, (f_score << f_shift) | (tentative_g << g_shift) | neighbor)
 
     return []
 
@@ -196,24 +307,56 @@ def astar(
 class SimulationEngine:
     def __init__(self) -> None:
         self.tick_count = 0
-        self.completed_times: list[float] = []
+        # Running metrics, updated where statuses change so get_state() does
+        # not rescan robots and missions.
+        self._completed_count = 0
+        self._active_robots = 0
+        self._total_distance = 0
+        self._completion_time_sum = 0.0
+        self._completion_time_count = 0
         self.robots: list[Robot] = []
         self.missions: list[Mission] = []
+        self.missions_by_id: dict[int, Mission] = {}
+        # Pending missions as (-priority score, mission id): highest priority
+        # first, then oldest. Pushed only when a mission becomes pending.
+        self._pending_heap: list[tuple[int, int]] = []
+        # Set when a robot may need charging attention (low battery, or
+        # standing on a station below full); cleared once a pass finds none.
+        self._battery_work = False
         self.obstacles: list[Obstacle] = []
         self.charging_stations: list[ChargingStation] = []
-        self.blocked: set[tuple[int, int]] = set()
+        self.station_positions: tuple[tuple[int, int], ...] = ()
+        self.station_set: frozenset[tuple[int, int]] = frozenset()
+        # Output models for the static map, built once per reset.
+        self.obstacles_out: list[ObstacleOut] = []
+        self.charging_stations_out: list[ChargingStationOut] = []
+        # Closest station (Manhattan) for every cell, indexed y * GRID_SIZE + x.
+        self.nearest_station: tuple[tuple[int, int], ...] = ()
+        # Flat obstacle grid: blocked_grid[y * GRID_SIZE + x] is 1 for obstacles.
+        self.blocked_grid = bytearray(GRID_SIZE * GRID_SIZE)
+        self._timestamp_str = ""
+        self.latest_state: Optional[SimulationStateOut] = None
         self.reset()
 
     def reset(self) -> None:
         self.tick_count = 0
-        self.completed_times.clear()
+        self._completed_count = 0
+        self._total_distance = 0
+        self._completion_time_sum = 0.0
+        self._completion_time_count = 0
 
         self.charging_stations = [
             ChargingStation(5, 5),
             ChargingStation(45, 5),
             ChargingStation(25, 45),
         ]
-        station_positions = {(s.x, s.y) for s in self.charging_stations}
+        self.station_positions = tuple((s.x, s.y) for s in self.charging_stations)
+        self.station_set = frozenset(self.station_positions)
+        self.nearest_station = tuple(
+            min(self.station_positions, key=lambda p: abs(p[0] - x) + abs(p[1] - y))
+            for y in range(GRID_SIZE)
+            for x in range(GRID_SIZE)
+        )
 
         obstacle_positions: set[tuple[int, int]] = set()
         while len(obstacle_positions) < 10:
@@ -221,25 +364,45 @@ class SimulationEngine:
                 random.randint(0, GRID_SIZE - 1),
                 random.randint(0, GRID_SIZE - 1),
             )
-            if candidate in station_positions:
+            if candidate in self.station_set:
                 continue
             obstacle_positions.add(candidate)
         self.obstacles = [Obstacle(x, y) for x, y in obstacle_positions]
-        self.blocked = {(o.x, o.y) for o in self.obstacles}
+        self.obstacles_out = [ObstacleOut(type=o.type, x=o.x, y=o.y) for o in self.obstacles]
+        self.charging_stations_out = [
+            ChargingStationOut(x=station.x, y=station.y) for station in self.charging_stations
+        ]
+        self.blocked_grid = bytearray(GRID_SIZE * GRID_SIZE)
+        for obstacle in self.obstacles:
+            self.blocked_grid[obstacle.y * GRID_SIZE + obstacle.x] = 1
+
+        # Robots and missions are placed by sampling the free cells directly,
+        # so placement takes one draw however crowded the map is.
+        occupied = bytearray(self.blocked_grid)
+        for x, y in self.station_positions:
+            occupied[y * GRID_SIZE + x] = 1
+        free_cells = [index for index in range(GRID_SIZE * GRID_SIZE) if not occupied[index]]
 
         self.robots = []
         for robot_id in range(1, 6):
-            x, y = self._random_free_cell(station_positions=station_positions)
+            y, x = divmod(random.choice(free_cells), GRID_SIZE)
             self.robots.append(Robot(robot_id, x, y))
 
         self.missions = []
         mission_id = 1
         for priority in ("high", "medium", "low"):
             for _ in range(5):
-                tx, ty = self._random_free_cell(station_positions=station_positions)
+                ty, tx = divmod(random.choice(free_cells), GRID_SIZE)
                 self.missions.append(Mission(mission_id, priority, tx, ty))
                 mission_id += 1
-
+        self.missions_by_id = {m.id: m for m in self.missions}
+        self._battery_work = False
+        self._pending_heap = []
+        for mission in self.missions:
+            self._queue_pending(mission)
+        self._active_robots = len(self.robots)
+
+        self._publish_state()
         logger.info(
             "Simulation reset: robots=%s missions=%s obstacles=%s",
             len(self.robots),
@@ -247,14 +410,6 @@ class SimulationEngine:
             len(self.obstacles),
         )
 
-    def _random_free_cell(self, station_positions: set[tuple[int, int]]) -> tuple[int, int]:
-        while True:
-            x = random.randint(0, GRID_SIZE - 1)
-            y = random.randint(0, GRID_SIZE - 1)
-            pos = (x, y)
-            if pos not in self.blocked and pos not in station_positions:
-                return pos
-
     def tick(self) -> None:
         self.tick_count += 1
         self._assign_pending_missions()
@@ -262,42 +417,65 @@ class SimulationEngine:
         self._process_mission_completion()
         self._manage_battery_and_charging()
         self._mark_dead_robots()
+        self._publish_state()
+
+    def _publish_state(self) -> None:
+        # State only changes in tick() and reset(), so build the snapshot here
+        # once; readers take latest_state without locking. The timestamp is
+        # likewise formatted once per change rather than per get_state() call.
+        self._timestamp_str = (
+            datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+        )
+        self.latest_state = self.get_state()
+
+    def _queue_pending(self, mission: Mission) -> None:
+        heapq.heappush(
+            self._pending_heap, (-mission.priority_score, mission.id)
+        )
 
     def _assign_pending_missions(self) -> None:
-        pending = [m for m in self.missions if m.status == "pending"]
-        if not pending:
+        if not self._pending_heap:
             return
-        pending.sort(key=lambda m: PRIORITY_SCORES.get(m.priority, 0), reverse=True)
 
-        for mission in pending:
+        unreachable: list[Mission] = []
+        while self._pending_heap:
             idle_robots = [
                 r
                 for r in self.robots
-                if r.status == "idle" and r.battery > MIN_BATTERY_FOR_MISSION
+                if r.status_code == STATUS_IDLE and r.battery > _MIN_BATTERY_FOR_MISSION
             ]
             if not idle_robots:
-                return
+                break
+            mission = self.missions_by_id[heapq.heappop(self._pending_heap)[1]]
 
-            nearest_robot = min(
+            # Pick by path length: try robots in Manhattan order and stop once
+            # no remaining robot's lower bound can beat the best path so far.
+            goal = (mission.target_x, mission.target_y)
+            candidates = sorted(
                 idle_robots,
                 key=lambda r: abs(r.x - mission.target_x) + abs(r.y - mission.target_y),
             )
-            path = astar(
-                start=(nearest_robot.x, nearest_robot.y),
-                goal=(mission.target_x, mission.target_y),
-                blocked=self.blocked,
-            )
-            if not path:
+            nearest_robot: Optional[Robot] = None
+            path: list[tuple[int, int]] = []
+            for robot in candidates:
+                if path and abs(robot.x - goal[0]) + abs(robot.y - goal[1]) >= len(path) - 1:
+                    break
+                candidate_path = astar((robot.x, robot.y), goal, self.blocked_grid)
+                if candidate_path and (not path or len(candidate_path) < len(path)):
+                    nearest_robot = robot
+                    path = candidate_path
+            if nearest_robot is None:
                 logger.warning(
                     "Mission %s currently unreachable at (%s,%s)",
                     mission.id,
                     mission.target_x,
                     mission.target_y,
                 )
+                unreachable.append(mission)
                 continue
 
-            nearest_robot.path = path[1:]
-            nearest_robot.status = "moving"
+            nearest_robot.path = deque(path[1:])
+            nearest_robot.status_code = STATUS_MOVING
             nearest_robot.mission_id = mission.id
             nearest_robot.charge_destination = None
 
@@ -312,92 +490,108 @@ class SimulationEngine:
                 nearest_robot.id,
             )
 
+        for mission in unreachable:
+            self._queue_pending(mission)
+
     def _move_robots_one_step(self) -> None:
         for robot in self.robots:
-            if robot.status != "moving":
+            if robot.status_code != STATUS_MOVING:
                 continue
 
             if not robot.path:
                 # Arrived at destination used by mission or charging route.
                 if robot.charge_destination and (robot.x, robot.y) == robot.charge_destination:
-                    robot.status = "charging"
+                    robot.status_code = STATUS_CHARGING
                 else:
-                    robot.status = "idle"
+                    robot.status_code = STATUS_IDLE
                 continue
 
-            next_x, next_y = robot.path.pop(0)
+            next_x, next_y = robot.path.popleft()
             robot.x, robot.y = next_x, next_y
-            robot.battery = max(0.0, robot.battery - BATTERY_DRAIN_PER_MOVE)
-            robot.total_distance_traveled += 1.0
+            robot.battery = max(0, robot.battery - _BATTERY_DRAIN_PER_MOVE)
+            robot.total_distance_traveled += 1
+            self._total_distance += 1
+            if robot.battery < _LOW_BATTERY_THRESHOLD or (next_x, next_y) in self.station_set:
+                self._battery_work = True
 
     def _process_mission_completion(self) -> None:
         for robot in self.robots:
-            if robot.status == "dead" or robot.mission_id is None:
+            if robot.status_code == STATUS_DEAD or robot.mission_id is None:
                 continue
 
-            mission = next((m for m in self.missions if m.id == robot.mission_id), None)
+            mission = self.missions_by_id.get(robot.mission_id)
             if mission is None or mission.status != "active":
                 continue
 
             at_target = robot.x == mission.target_x and robot.y == mission.target_y
             if at_target and not robot.path:
                 mission.status = "completed"
+                self._completed_count += 1
                 mission.completion_time = time.time()
                 if mission.start_time is not None:
-                    self.completed_times.append(mission.completion_time - mission.start_time)
+                    self._completion_time_sum += mission.completion_time - mission.start_time
+                    self._completion_time_count += 1
                 robot.mission_id = None
                 robot.path.clear()
-                robot.status = "idle"
+                robot.status_code = STATUS_IDLE
                 logger.info("Mission %s completed by robot %s", mission.id, robot.id)
 
     def _manage_battery_and_charging(self) -> None:
-        stations = [(s.x, s.y) for s in self.charging_stations]
+        if not self._battery_work:
+            return
+        stations = self.station_set
+        still_needed = False
 
         for robot in self.robots:
-            if robot.status == "dead":
+            if robot.status_code == STATUS_DEAD:
                 continue
 
             at_station = (robot.x, robot.y) in stations
-            if at_station and robot.battery < 100:
-                robot.status = "charging"
-                robot.battery = min(100.0, robot.battery + BATTERY_CHARGE_PER_TICK)
+            if at_station and robot.battery < _BATTERY_FULL:
+                robot.status_code = STATUS_CHARGING
+                robot.battery = min(_BATTERY_FULL, robot.battery + _BATTERY_CHARGE_PER_TICK)
                 robot.path.clear()
                 robot.charge_destination = (robot.x, robot.y)
-                if robot.battery >= 100:
-                    robot.status = "idle"
+                if robot.battery >= _BATTERY_FULL:
+                    robot.status_code = STATUS_IDLE
                     robot.charge_destination = None
+                else:
+                    still_needed = True
                 continue
 
-            if robot.battery < LOW_BATTERY_THRESHOLD and not at_station:
-                if robot.status != "idle":
+            if robot.battery < _LOW_BATTERY_THRESHOLD and not at_station:
+                still_needed = True
+                if robot.status_code != STATUS_IDLE:
                     continue
                 if robot.mission_id is not None:
                     continue
 
-                nearest_station = min(
-                    stations, key=lambda p: abs(p[0] - robot.x) + abs(p[1] - robot.y)
-                )
-                path = astar((robot.x, robot.y), nearest_station, self.blocked)
+                nearest_station = self.nearest_station[robot.y * GRID_SIZE + robot.x]
+                path = astar((robot.x, robot.y), nearest_station, self.blocked_grid)
                 if path:
-                    robot.path = path[1:]
+                    robot.path = deque(path[1:])
                     robot.charge_destination = nearest_station
-                    robot.status = "moving"
+                    robot.status_code = STATUS_MOVING
                 else:
                     # If no route to charger exists, robot cannot continue operating.
-                    robot.status = "dead"
+                    robot.status_code = STATUS_DEAD
+                    self._active_robots -= 1
                     robot.path.clear()
                     logger.error(
                         "Robot %s cannot reach charging station and is marked dead",
                         robot.id,
                     )
 
+        self._battery_work = still_needed
+
     def _mark_dead_robots(self) -> None:
         for robot in self.robots:
-            if robot.status == "dead":
+            if robot.status_code == STATUS_DEAD:
                 continue
-            if robot.battery <= 0.0:
+            if robot.battery <= 0:
                 self._release_mission(robot)
-                robot.status = "dead"
+                robot.status_code = STATUS_DEAD
+                self._active_robots -= 1
                 robot.path.clear()
                 robot.charge_destination = None
                 logger.warning("Robot %s battery depleted, marked dead", robot.id)
@@ -405,39 +599,34 @@ class SimulationEngine:
     def _release_mission(self, robot: Robot) -> None:
         if robot.mission_id is None:
             return
-        mission = next((m for m in self.missions if m.id == robot.mission_id), None)
+        mission = self.missions_by_id.get(robot.mission_id)
         if mission and mission.status == "active":
             mission.status = "pending"
+            self._queue_pending(mission)
             mission.assigned_robot = None
             mission.start_time = None
         robot.mission_id = None
 
     def get_state(self) -> SimulationStateOut:
-        completed = sum(1 for m in self.missions if m.status == "completed")
-        pending = sum(1 for m in self.missions if m.status == "pending")
-        active_robots = sum(1 for r in self.robots if r.status != "dead")
-        total_distance = sum(r.total_distance_traveled for r in self.robots)
         avg_completion = (
-            sum(self.completed_times) / len(self.completed_times) if self.completed_times else 0.0
+            self._completion_time_sum / self._completion_time_count
+            if self._completion_time_count
+            else 0.0
         )
-        timestamp = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
         return SimulationStateOut(
             robots=[robot.to_out() for robot in self.robots],
             missions=[mission.to_out() for mission in self.missions],
-            obstacles=[ObstacleOut(type=o.type, x=o.x, y=o.y) for o in self.obstacles],
-            charging_stations=[
-                ChargingStationOut(x=station.x, y=station.y)
-                for station in self.charging_stations
-            ],
+            obstacles=self.obstacles_out,
+            charging_stations=self.charging_stations_out,
             metrics=MetricsOut(
-                active_robots=active_robots,
-                completed_missions=completed,
-                pending_missions=pending,
-                total_distance_traveled=round(total_distance, 1),
+                active_robots=self._active_robots,
+                completed_missions=self._completed_count,
+                pending_missions=len(self._pending_heap),
+                total_distance_traveled=float(self._total_distance),
                 avg_completion_time=round(avg_completion, 1),
             ),
-            timestamp=timestamp,
+            timestamp=self._timestamp_str,
         )
 
 
@@ -503,8 +692,8 @@ async def health_check() -> dict[str, str]:
 
 @app.get("/simulation/state", response_model=SimulationStateOut)
 async def get_simulation_state() -> SimulationStateOut:
-    async with state_lock:
-        return engine.get_state()
+    # Rebinding latest_state is atomic, so no lock is needed to read it.
+    return engine.latest_state
 
 
 @app.post("/simulation/reset")